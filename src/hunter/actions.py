@@ -167,7 +167,7 @@ class ColorStreamAction(Action):
             if value in self._stream_cache:
                 value = self._stream_cache[value]
             else:
-                value = self._stream_cache[value] = open(value, 'a', buffering=0)
+                value = self._stream_cache[value] = open(value, 'a', buffering=1)
 
         isatty = getattr(value, 'isatty', None)
         if self.force_colors or (isatty and isatty() and os.name != 'java'):
@@ -328,10 +328,11 @@ class ColorStreamAction(Action):
 
         Returns: string
         """
-        self.stream.write(format_str.format(
-            *args,
-            **dict(self.other_colors, **kwargs)
-        ))
+        if kwargs:
+            colors = dict(self.other_colors, **kwargs)
+        else:
+            colors = self.other_colors
+        self.stream.write(format_str.format(*args, **colors))
 
 
 class CodePrinter(ColorStreamAction):
@@ -427,10 +428,7 @@ class CallPrinter(CodePrinter):
         Handle event and print filename, line number and source code. If event.kind is a `return` or `exception` also
         prints values.
         """
-        ident = event.module, event.function
-
-        thread = threading.current_thread()
-        stack = self.locals[thread.ident]
+        stack = self.locals[get_ident()]
 
         pid_prefix = self.pid_prefix()
         thread_prefix = self.thread_prefix(event)
@@ -438,7 +436,9 @@ class CallPrinter(CodePrinter):
 
         if event.kind == 'call':
             code = event.code
-            stack.append(ident)
+            frame_locals = event.locals
+            value_repr = self.try_str if event.detached else self.try_repr
+            stack.append((event.module, event.function))
             self.output(
                 '{}{}{}{KIND}{:9} {}{COLOR}=>{NORMAL} {}({}{COLOR}{NORMAL}){RESET}\n',
                 pid_prefix,
@@ -449,7 +449,7 @@ class CallPrinter(CodePrinter):
                 event.function,
                 ', '.join('{VARS}{VARS-NAME}{0}{VARS}={RESET}{1}'.format(
                     var,
-                    self.try_str(event.locals.get(var, MISSING)) if event.detached else self.try_repr(event.locals.get(var, MISSING)),
+                    value_repr(frame_locals.get(var, MISSING)),
                     **self.other_colors
                 ) for var in code.co_varnames[:code.co_argcount]),
                 COLOR=self.event_colors.get(event.kind),
@@ -479,7 +479,7 @@ class CallPrinter(CodePrinter):
                 self.try_str(event.arg) if event.detached else self.try_repr(event.arg),
                 COLOR=self.event_colors.get(event.kind),
             )
-            if stack and stack[-1] == ident:
+            if stack and stack[-1] == (event.module, event.function):
                 stack.pop()
         else:
             self.output(
@@ -532,9 +532,16 @@ class VarsPrinter(ColorStreamAction):
         filename_prefix = self.filename_prefix(event)
         empty_filename_prefix = self.filename_prefix()
 
+        eval_globals = None
+
         for code, symbols in self.names.items():
+            if not frame_symbols >= symbols:
+                # not all the names are visible from this frame, don't bother evaluating
+                continue
+            if eval_globals is None:
+                eval_globals = dict(vars(builtins), **event.globals)
             try:
-                obj = eval(code, dict(vars(builtins), **event.globals), event.locals)
+                obj = eval(code, eval_globals, event.locals)
             except AttributeError:
                 continue
             except Exception as exc:
@@ -542,27 +549,26 @@ class VarsPrinter(ColorStreamAction):
             else:
                 printout = self.try_str(obj) if event.detached else self.try_repr(obj)
 
-            if frame_symbols >= symbols:
-                if first:
-                    self.output(
-                        '{}{}{}{KIND}{:9} {VARS}[{VARS-NAME}{} {VARS}=> {RESET}{}{VARS}]{RESET}\n',
-                        pid_prefix,
-                        thread_prefix,
-                        filename_prefix,
-                        event.kind,
-                        code,
-                        printout,
-                    )
-                    first = False
-                else:
-                    self.output(
-                        '{}{}{}{CONT}...       {VARS}[{VARS-NAME}{} {VARS}=> {RESET}{}{VARS}]{RESET}\n',
-                        pid_prefix,
-                        thread_prefix,
-                        empty_filename_prefix,
-                        code,
-                        printout,
-                    )
+            if first:
+                self.output(
+                    '{}{}{}{KIND}{:9} {VARS}[{VARS-NAME}{} {VARS}=> {RESET}{}{VARS}]{RESET}\n',
+                    pid_prefix,
+                    thread_prefix,
+                    filename_prefix,
+                    event.kind,
+                    code,
+                    printout,
+                )
+                first = False
+            else:
+                self.output(
+                    '{}{}{}{CONT}...       {VARS}[{VARS-NAME}{} {VARS}=> {RESET}{}{VARS}]{RESET}\n',
+                    pid_prefix,
+                    thread_prefix,
+                    empty_filename_prefix,
+                    code,
+                    printout,
+                )
 
 
 class VarsSnooper(ColorStreamAction):
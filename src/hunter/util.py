@@ -79,6 +79,7 @@ CODE_COLORS = {
     'exception': Fore.RED,
 }
 MISSING = type('MISSING', (), {'__repr__': lambda _: '?'})()
+PRIMITIVE_TYPES = (str, int, float, bool, type(None), bytes)
 BUILTIN_SYMBOLS = set(vars(builtins))
 CYTHON_SUFFIX_RE = re.compile(r'([.].+)?[.](so|pyd)$', re.IGNORECASE)
 LEADING_WHITESPACE_RE = re.compile('(^[ \t]*)(?:[^ \t\n])', re.MULTILINE)
@@ -142,6 +143,10 @@ def safe_repr(obj, maxdepth=5):
         return '...'
     obj_type = type(obj)
     obj_type_type = type(obj_type)
+    # exact primitives are the bulk of what gets represented, skip all the checks below
+    # (the metaclass check comes first so the tuple lookup can't end up calling a custom __eq__)
+    if obj_type_type is type and obj_type in PRIMITIVE_TYPES:
+        return repr(obj)
     newdepth = maxdepth - 1
 
     # only represent exact builtins
@@ -292,6 +292,19 @@ def test_tracing_vars_expressions(LineMatcher):
     ])
 
 
+def test_tracing_vars_missing_names():
+    evaluated = []
+    lines = StringIO()
+    with hunter.trace(actions=[VarsPrinter('evaluated.append(1) or missing_name', stream=lines)]):
+        def a():
+            b = len(evaluated)
+            return b
+
+        a()
+    assert not evaluated
+    assert lines.getvalue() == ''
+
+
 def test_trace_merge():
     with hunter.trace(function='a'):
         with hunter.trace(function='b'):
@@ -411,6 +424,22 @@ def test_callprinter(LineMatcher):
     ])
 
 
+def test_callprinter_stream_path(LineMatcher, tmpdir):
+    path = tmpdir.join('trace.log')
+    with hunter.trace(function='foo', action=CallPrinter(stream=str(path))):
+        def foo():
+            return 1
+
+        foo()
+
+    lm = LineMatcher(path.read().splitlines())
+    lm.fnmatch_lines([
+        '* call      => foo()',
+        '* line         return 1',
+        '* return    <= foo: 1',
+    ])
+
+
 def test_callprinter_indent(LineMatcher):
     from sample6 import bar
     out = StringIO()
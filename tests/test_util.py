@@ -88,6 +88,19 @@ def test_safe_repr():
     assert safe_repr(py.io).startswith('<py._vendored_packages.apipkg.ApiModule object at 0x')
 
 
+def test_safe_repr_primitives():
+    for obj in ['a\nb', b'c', 1, 2.5, True, None]:
+        assert safe_repr(obj) == repr(obj)
+    assert safe_repr(1, maxdepth=0) == '...'
+
+    class Str(str):
+        def __repr__(self):
+            return 'Str!'
+
+    obj = Str('x')
+    assert safe_repr(obj) == object.__repr__(obj)
+
+
 def test_reliable_primitives():
     # establish a baseline for primitives that cannot be messed with descriptors and metaclasses
     side_effects = []